@@ -7,316 +7,750 @@ Enhanced Professional Version with Improved UI/UX
 
 import sys
 import os
+import re
+import ssl
 import json
+import hashlib
+import unicodedata
+import importlib.util
+import multiprocessing
+import asyncio
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import aiohttp
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
 import threading
 import time
 import webbrowser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from urllib.parse import urljoin, urlparse
 import csv
+from collections import Counter
+from typing import NamedTuple
+
+try:
+    import lxml  # noqa: F401 - BeautifulSoup's 'lxml' parser backend
+except ImportError:
+    raise ImportError("NewsVision requires lxml for HTML parsing. Install it with: pip install lxml") from None
+
+try:
+    import orjson  # Optional: much faster JSON export
+except ImportError:
+    orjson = None
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
-    QWidget, QPushButton, QLabel, QComboBox, QTableWidget, 
-    QTableWidgetItem, QTextEdit, QProgressBar, QSplitter,
+    QWidget, QPushButton, QLabel, QComboBox, QTableView, 
+    QTextEdit, QProgressBar, QSplitter,
     QGroupBox, QCheckBox, QSpinBox, QLineEdit, QTabWidget,
     QFileDialog, QMessageBox, QStatusBar, QHeaderView,
-    QFrame, QScrollArea, QGridLayout, QTreeWidget, QTreeWidgetItem
+    QFrame, QScrollArea, QGridLayout, QTreeView
 )
 from PyQt6.QtCore import (
-    Qt, QThread, pyqtSignal, QTimer, QSettings, 
+    Qt, QThread, pyqtSignal, QTimer, QSettings, QStandardPaths,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
     QPropertyAnimation, QEasingCurve, QRect
 )
 from PyQt6.QtGui import (
     QFont, QPalette, QColor, QIcon, QPixmap, 
-    QLinearGradient, QBrush, QAction, QKeySequence
+    QLinearGradient, QBrush, QAction, QKeySequence,
+    QStandardItemModel, QStandardItem
 )
 
 
+# aiohttp can only decode Brotli bodies when a Brotli binding is installed,
+# so only ask servers for br when it will be understood
+HAS_BROTLI = any(importlib.util.find_spec(name) for name in ('brotli', 'brotlicffi'))
+ACCEPT_ENCODING = 'br, gzip;q=0.9, deflate;q=0.8' if HAS_BROTLI else 'gzip, deflate'
+
+# Browser identity sent by the scraper and the URL tester
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+
+# Enhanced headers to bypass anti-bot protection, shared by every scrape request
+BASE_HEADERS = {
+    'User-Agent': BROWSER_USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0'
+}
+
+# One TLS context for the whole app: CA certificates are loaded once and every
+# pooled connection shares the same verified configuration
+SSL_CONTEXT = ssl.create_default_context()
+
+# Keep-alive connection pool for synchronous requests made outside the scraper
+# thread, so repeated tests against one site reuse a single TLS connection
+HTTP_SESSION = requests.Session()
+HTTP_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=4,
+                           max_retries=Retry(total=2, read=0, backoff_factor=0.3))
+HTTP_SESSION.mount('http://', HTTP_ADAPTER)
+HTTP_SESSION.mount('https://', HTTP_ADAPTER)
+HTTP_SESSION.headers.update({
+    'User-Agent': BROWSER_USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+})
+
+# Sent instead when a site answers the default browser identity with 403
+FALLBACK_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15'
+
+# Short titles matching these look like navigation links or ads, not headlines
+SKIP_RE = re.compile(
+    r'\b(?:home|news|sports|business|opinion|entertainment|login|subscribe|advertisement|'
+    r'more|latest|breaking|top stories|read more|view all|load more)\b', re.I)
+
+# Runs of whitespace inside titles collapse to a single space
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Only letters, digits and combining marks count when comparing titles. The
+# marks carry vowel signs in Indic scripts, so they can't be dropped with \W
+TITLE_KEPT_CATEGORIES = frozenset('LMN')
+
+
+def title_fingerprint(title):
+    """Return a compact key that matches titles differing only in case or punctuation"""
+    folded = title.casefold()
+    normalized = ''.join(ch for ch in folded if unicodedata.category(ch)[0] in TITLE_KEPT_CATEGORIES)
+    # Titles made only of punctuation or symbols would otherwise all share the empty key
+    normalized = normalized or folded
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest()
+
+
+def display_timestamp(timestamp):
+    """Format an ISO-8601 headline timestamp for display"""
+    return timestamp.replace('T', ' ')
+
+
+# Tags that can hold a headline or its link
+HEADLINE_TAGS = ('a', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# Selectors made only of type/class names and descendant/child combinators can be strained
+STRAINABLE_SELECTOR_RE = re.compile(r'^[\w\s.>-]+$')
+SELECTOR_TYPE_RE = re.compile(r'(?:^|[\s>])([a-zA-Z][\w-]*)')
+SELECTOR_CLASS_RE = re.compile(r'\.([\w-]+)')
+
+
+class HeadlineStrainer(SoupStrainer):
+    """Only build the parts of a page that a source's selectors can match"""
+    def __init__(self, tag_names, class_names):
+        super().__init__()
+        self.tag_names = frozenset(tag_names)
+        self.class_names = frozenset(class_names)
+    
+    @classmethod
+    def for_selectors(cls, selectors):
+        """Build a strainer for the given CSS selectors, or None if they need the full tree"""
+        if not all(STRAINABLE_SELECTOR_RE.match(selector) for selector in selectors):
+            return None
+        
+        tag_names = set(HEADLINE_TAGS)
+        class_names = set()
+        for selector in selectors:
+            tag_names.update(SELECTOR_TYPE_RE.findall(selector))
+            class_names.update(SELECTOR_CLASS_RE.findall(selector))
+        return cls(tag_names, class_names)
+    
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        # Accepted tags keep their whole subtree, so wrappers named by a
+        # selector (e.g. '.story-list h3 a') still contain their headlines
+        if name in self.tag_names:
+            return True
+        
+        classes = (attrs or {}).get('class')
+        if not classes:
+            return False
+        if isinstance(classes, str):
+            classes = classes.split()
+        return not self.class_names.isdisjoint(classes)
+
+
+# Generic headline patterns for sources whose own selectors may not fit the page
+FALLBACK_SELECTORS = (
+    'a[href*="news"]', 'a[href*="story"]', 'a[href*="article"]',
+    '.headline', '.title', '.news-title', '.story-headline',
+    'h1 a', 'h2 a', 'h3 a', 'h4 a',
+    '[class*="headline"]', '[class*="title"]', '[class*="story"]'
+)
+COMPILED_FALLBACK_SELECTORS = tuple(soupsieve.compile(selector) for selector in FALLBACK_SELECTORS)
+
+# Common headline patterns probed by the URL tester, compiled once for every test
+DIAGNOSTIC_SELECTORS = (
+    'h1', 'h2', 'h3', 'h4',
+    '.title a', '.headline', '.story-title',
+    'a[href*="news"]', 'a[href*="story"]',
+    '.ie-custom-story-item h3 a',  # Indian Express specific
+    '.story-details h3 a'  # Indian Express specific
+)
+COMPILED_DIAGNOSTIC_SELECTORS = tuple((selector, soupsieve.compile(selector)) for selector in DIAGNOSTIC_SELECTORS)
+# Once a selector matches this many elements and a few candidates are listed, the rest add nothing
+DIAGNOSTIC_STRONG_MATCH = 20
+
+
+def select_first_matching(soup, matchers):
+    """Return the matches of the first selector, in priority order, that finds anything"""
+    for matcher in matchers:
+        elements = matcher.select(soup)
+        if elements:
+            return elements
+    return []
+
+
+def is_rss_feed(rss_url):
+    """Check whether a URL serves an XML feed, using the shared session"""
+    try:
+        # Headers are enough to spot a feed; only download it if HEAD is refused
+        response = HTTP_SESSION.head(rss_url, timeout=3, allow_redirects=True)
+        if response.status_code == 405:
+            response = HTTP_SESSION.get(rss_url, timeout=5)
+        return response.status_code == 200 and 'xml' in response.headers.get('content-type', '')
+    except requests.exceptions.RequestException:
+        return False
+
+
+class Headline(NamedTuple):
+    """A scraped headline; field order matches the results table columns"""
+    title: str
+    source: str
+    timestamp: str
+    url: str
+
+
 class NewsSource:
     """Class to define news source configurations"""
-    def __init__(self, name, url, selectors):
+    __slots__ = ('name', 'url', 'selectors', 'compiled_selectors', 'use_fallback_selectors', 'strainer')
+    
+    def __init__(self, name, url, selectors, use_fallback_selectors=False):
         self.name = name
         self.url = url
-        self.selectors = selectors  # List of CSS selectors to try
+        self.selectors = tuple(selectors)  # CSS selectors to try, in priority order
+        self.compiled_selectors = tuple(soupsieve.compile(selector) for selector in self.selectors)
+        self.use_fallback_selectors = use_fallback_selectors
+        
+        strained_selectors = list(self.selectors)
+        if use_fallback_selectors:
+            strained_selectors.extend(FALLBACK_SELECTORS)
+        self.strainer = HeadlineStrainer.for_selectors(strained_selectors)
+
+
+class ResponseCache:
+    """On-disk cache of page bodies with their ETag/Last-Modified validators"""
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        
+    def _path(self, url, suffix):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key + suffix)
+    
+    def validators(self, url):
+        """Return conditional request headers for a previously cached URL"""
+        try:
+            with open(self._path(url, '.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not os.path.exists(self._path(url, '.html')):
+            return {}
+        
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def load(self, url):
+        """Return the cached (body, charset) for a URL, or None if it is not cached"""
+        try:
+            with open(self._path(url, '.html'), 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        
+        try:
+            with open(self._path(url, '.json'), encoding='utf-8') as f:
+                charset = json.load(f).get('charset')
+        except (OSError, ValueError):
+            charset = None
+        return content, charset
+    
+    def store(self, url, headers, content, charset=None):
+        """Cache a body if the server sent validators to revalidate it with"""
+        meta = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'charset': charset
+        }
+        if not meta['etag'] and not meta['last_modified']:
+            return
+        
+        try:
+            body_path = self._path(url, '.html')
+            with open(body_path + '.tmp', 'wb') as f:
+                f.write(content)
+            os.replace(body_path + '.tmp', body_path)
+            
+            with open(self._path(url, '.json'), 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except OSError:
+            pass
+
+
+def parse_page(content, source, max_headlines, encoding=None):
+    """Extract headlines from downloaded page content
+    
+    Runs in a worker process, so it only touches its picklable arguments.
+    A known encoding spares BeautifulSoup from sniffing the raw bytes for one.
+    """
+    headlines = []
+    
+    soup = BeautifulSoup(content, 'lxml', parse_only=source.strainer, from_encoding=encoding)
+    
+    # Try different selectors for this source
+    elements = select_first_matching(soup, source.compiled_selectors)
+    
+    # If no elements found with CSS selectors, try common patterns where allowed.
+    # These scan every href and class on the page, so well-configured sources skip them
+    if not elements and source.use_fallback_selectors:
+        elements = select_first_matching(soup, COMPILED_FALLBACK_SELECTORS)
+    
+    count = 0
+    processed_titles = set()  # To avoid duplicates
+    timestamp = datetime.now().isoformat(timespec='seconds')  # Shared by every headline on the page
+    
+    for element in elements:
+        if count >= max_headlines:
+            break
+            
+        title = ""
+        # Try different ways to extract title
+        if element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            title = element.get_text().strip()
+        elif element.name == 'a':
+            title = element.get_text().strip()
+            if not title:
+                # Try getting title from nested elements
+                nested = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'span', 'div'])
+                if nested:
+                    title = nested.get_text().strip()
+        else:
+            title = element.get_text().strip()
+        
+        # Clean up title
+        title = WHITESPACE_RE.sub(' ', title).strip()  # Remove extra whitespace
+        
+        # Skip if title is too short or empty
+        if not title or len(title) < 15:
+            continue
+        
+        # Skip if title looks like navigation or ads
+        if len(title) < 30 and SKIP_RE.search(title):
+            continue
+        
+        # Skip near-identical duplicates
+        fingerprint = title_fingerprint(title)
+        if fingerprint in processed_titles:
+            continue
+        processed_titles.add(fingerprint)
+        
+        # Try to get the link. It is usually the element itself or inside it; headings
+        # wrapped by their link are covered by the parent check and the ancestor walk
+        parent = element.parent
+        if element.name == 'a':
+            link_element = element
+        elif parent is not None and parent.name == 'a':
+            link_element = parent
+        else:
+            link_element = element.find('a') or element.find_parent('a')
+        link = link_element.get('href') if link_element else None
+        
+        # Make link absolute
+        if link and not link.startswith('http'):
+            link = urljoin(source.url, link)
+        
+        headlines.append(Headline(title, source.name, timestamp, link or source.url))
+        count += 1
+    
+    return headlines
 
 
 class ScraperThread(QThread):
     """Background thread for scraping operations"""
     progress_update = pyqtSignal(int)
-    headline_found = pyqtSignal(dict)  # {title, url, source, timestamp}
-    finished_scraping = pyqtSignal(list)
+    headlines_batch = pyqtSignal(list)  # [Headline, ...]
+    finished_scraping = pyqtSignal()
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, sources, max_headlines=50):
+    # Headlines are sent to the GUI in groups to limit cross-thread signals
+    batch_size = 10
+    
+    # Headlines sit near the top of the page, so bloated pages are cut short
+    max_body_bytes = 1024 * 1024
+    
+    # At most this many requests are in flight to one host at a time
+    host_limit = 2
+    
+    # Minimum spacing between requests to the same host, in seconds. The
+    # "Delay between requests" setting replaces the default; slow hosts keep
+    # their longer spacing
+    host_interval = 0.5
+    slow_host_intervals = {
+        'indianexpress.com': 2.0,
+        'timesofindia.indiatimes.com': 2.0
+    }
+    
+    # Rate-limited and failed requests are retried with exponential backoff
+    retry_statuses = (429, 500, 502, 503, 504)
+    
+    # Sites that answer the default browser identity with 403; they are retried with FALLBACK_USER_AGENT
+    fallback_agent_hosts = ('indianexpress.com', 'timesofindia.indiatimes.com')
+    max_retries = 3
+    retry_backoff = 1.0
+    
+    def __init__(self, sources, max_headlines=50, cache=None, parse_pool=None, timeout=15, delay=None):
         super().__init__()
         self.sources = sources
         self.max_headlines = max_headlines
+        self.timeout = timeout
+        if delay is not None:
+            self.host_interval = delay
+        self.cache = cache
+        self.parse_pool = parse_pool
+        self.parse_pool_broken = False  # Set when a parser worker died; the app then replaces the pool
         self.is_running = True
+        self._loop = None
+        self._task = None
+        self._host_next_ok = {}
+        self._host_locks = {}
         
     def run(self):
         """Main scraping logic"""
-        all_headlines = []
+        asyncio.run(self._run())
+        self.finished_scraping.emit()
+    
+    async def _run(self):
+        """Run the scrape as a task that stop() can cancel from the GUI thread"""
+        # The task is recorded before the loop, which is what stop() checks for
+        self._task = asyncio.current_task()
+        self._loop = asyncio.get_running_loop()
+        if not self.is_running:
+            return
+        
+        try:
+            await self._fetch_all()
+        except asyncio.CancelledError:
+            pass  # Stopped by the user; in-flight requests were abandoned
+    
+    async def _fetch_all(self):
+        """Fetch all sources concurrently, reporting progress as each one completes"""
         total_sources = len(self.sources)
         
-        for i, source in enumerate(self.sources):
-            if not self.is_running:
-                break
+        # Cap the number of sources downloading at once
+        semaphore = asyncio.Semaphore(5)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        # Pooled keep-alive connections shared by every source and retry. Idle
+        # sockets outlive the retry backoff so a retried request skips the TCP and
+        # TLS handshakes, and resolved hosts stay cached for the whole scrape.
+        # Each host gets only a couple of connections so no site is flooded.
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=self.host_limit, ssl=SSL_CONTEXT,
+                                         keepalive_timeout=30, ttl_dns_cache=300)
+        
+        async with aiohttp.ClientSession(headers=BASE_HEADERS, timeout=timeout, connector=connector) as session:
+            tasks = [self._fetch_one(session, semaphore, source) for source in self.sources]
+            
+            for completed, task in enumerate(asyncio.as_completed(tasks), 1):
+                if not self.is_running:
+                    break
                 
-            try:
-                headlines = self.scrape_source(source)
-                all_headlines.extend(headlines)
+                await task
                 
                 # Emit progress
-                progress = int((i + 1) / total_sources * 100)
+                progress = int(completed / total_sources * 100)
                 self.progress_update.emit(progress)
-                
-                # Small delay between requests
-                time.sleep(0.5)
-                
+    
+    async def _fetch_one(self, session, semaphore, source):
+        """Scrape a single source, reporting failures instead of raising"""
+        async with semaphore:
+            if not self.is_running:
+                return
+            
+            try:
+                await self.scrape_source(session, source)
             except Exception as e:
                 self.error_occurred.emit(f"Error scraping {source.name}: {str(e)}")
-        
-        self.finished_scraping.emit(all_headlines)
     
-    def scrape_source(self, source):
+    async def scrape_source(self, session, source):
         """Scrape headlines from a single source with enhanced anti-bot protection"""
-        headlines = []
-        
         try:
-            # Enhanced headers to bypass anti-bot protection
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0',
-                'Referer': source.url if source.url else 'https://www.google.com/'
-            }
-            
-            # Create a session for cookie management
-            session = requests.Session()
-            session.headers.update(headers)
-            
-            # Special handling for Indian websites that might have anti-bot protection
-            if 'indianexpress.com' in source.url or 'timesofindia.indiatimes.com' in source.url:
-                # Add additional delay for Indian sites
-                time.sleep(2)
-                
-                # Try to get the page with multiple attempts
-                max_attempts = 3
-                response = None
-                
-                for attempt in range(max_attempts):
-                    try:
-                        response = session.get(source.url, timeout=15, allow_redirects=True)
-                        if response.status_code == 200:
-                            break
-                        elif response.status_code == 403:
-                            # If blocked, try with different user agent
-                            session.headers.update({
-                                'User-Agent': f'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15'
-                            })
-                            time.sleep(3)  # Wait longer between attempts
-                        else:
-                            time.sleep(1)
-                    except Exception as e:
-                        if attempt == max_attempts - 1:
-                            raise e
-                        time.sleep(2)
-                
-                if not response or response.status_code != 200:
-                    raise Exception(f"Failed to access {source.name} after {max_attempts} attempts. Status: {response.status_code if response else 'No response'}")
-                    
-            else:
-                response = session.get(source.url, timeout=10, allow_redirects=True)
-                
-            response.raise_for_status()
-            
-            # Parse with different parsers if needed
-            soup = None
-            try:
-                soup = BeautifulSoup(response.content, 'lxml')
-            except:
-                try:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                except:
-                    soup = BeautifulSoup(response.content, 'html5lib')
+            content, charset = await self._download(session, source)
             
-            if not soup:
-                raise Exception("Failed to parse HTML content")
+            # Parsing is CPU-bound, run it in the process pool to sidestep the GIL
+            loop = asyncio.get_running_loop()
+            headlines = await loop.run_in_executor(
+                self.parse_pool, parse_page, content, source, self.max_headlines, charset)
             
-            # Try different selectors for this source
-            elements = []
-            for selector in source.selectors:
-                try:
-                    elements = soup.select(selector)
-                    if elements:
-                        break
-                except Exception as selector_error:
-                    continue
+            for start in range(0, len(headlines), self.batch_size):
+                self.headlines_batch.emit(headlines[start:start + self.batch_size])
             
-            # If no elements found with CSS selectors, try alternative methods
-            if not elements:
-                # Try finding headlines in common patterns
-                alternative_selectors = [
-                    'a[href*="news"]', 'a[href*="story"]', 'a[href*="article"]',
-                    '.headline', '.title', '.news-title', '.story-headline',
-                    'h1 a', 'h2 a', 'h3 a', 'h4 a',
-                    '[class*="headline"]', '[class*="title"]', '[class*="story"]'
-                ]
-                
-                for alt_selector in alternative_selectors:
-                    try:
-                        elements = soup.select(alt_selector)
-                        if elements:
-                            break
-                    except:
-                        continue
-            
-            count = 0
-            processed_titles = set()  # To avoid duplicates
-            
-            for element in elements:
-                if count >= self.max_headlines:
-                    break
-                    
-                title = ""
-                # Try different ways to extract title
-                if element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    title = element.get_text().strip()
-                elif element.name == 'a':
-                    title = element.get_text().strip()
-                    if not title:
-                        # Try getting title from nested elements
-                        nested = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'span', 'div'])
-                        if nested:
-                            title = nested.get_text().strip()
-                else:
-                    title = element.get_text().strip()
-                
-                # Clean up title
-                title = ' '.join(title.split())  # Remove extra whitespace
-                
-                # Skip if title is too short, empty, or duplicate
-                if not title or len(title) < 15 or title in processed_titles:
-                    continue
-                
-                # Skip if title looks like navigation or ads
-                skip_patterns = ['Home', 'News', 'Sports', 'Business', 'Opinion', 'Entertainment',
-                               'Login', 'Subscribe', 'Advertisement', 'More', 'Latest', 'Breaking',
-                               'Top Stories', 'Read More', 'View All', 'Load More']
-                
-                if any(pattern.lower() in title.lower() for pattern in skip_patterns) and len(title) < 30:
-                    continue
-                
-                processed_titles.add(title)
-                
-                # Try to get the link
-                link = None
-                if element.name == 'a':
-                    link = element.get('href')
-                else:
-                    link_element = element.find('a')
-                    if link_element:
-                        link = link_element.get('href')
-                
-                # Make link absolute
-                if link and not link.startswith('http'):
-                    from urllib.parse import urljoin
-                    link = urljoin(source.url, link)
-                
-                headline_data = {
-                    'title': title,
-                    'url': link or source.url,
-                    'source': source.name,
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                headlines.append(headline_data)
-                self.headline_found.emit(headline_data)
-                count += 1
-                
-        except requests.exceptions.RequestException as e:
-            if "403" in str(e) or "Forbidden" in str(e):
+        except BrokenProcessPool:
+            self.parse_pool_broken = True
+            raise Exception(f"The page parser stopped unexpectedly while reading {source.name}. Please try again.")
+        except asyncio.TimeoutError:
+            raise Exception(f"Timeout connecting to {source.name}. The website may be slow or unreachable.")
+        except aiohttp.ClientResponseError as e:
+            if e.status == 403:
                 raise Exception(f"Access denied to {source.name}. The website may be blocking automated requests. Try using a VPN or contact the site for API access.")
-            elif "timeout" in str(e).lower():
-                raise Exception(f"Timeout connecting to {source.name}. The website may be slow or unreachable.")
-            else:
-                raise Exception(f"Network error accessing {source.name}: {str(e)}")
+            raise Exception(f"Network error accessing {source.name}: {str(e)}")
+        except aiohttp.ClientError as e:
+            raise Exception(f"Network error accessing {source.name}: {str(e)}")
         except Exception as e:
             raise Exception(f"Failed to scrape {source.name}: {str(e)}")
+    
+    async def _download(self, session, source):
+        """Download the raw page content for a source, retrying transient failures"""
+        request_headers = {'Referer': source.url if source.url else 'https://www.google.com/'}
+        
+        # Revalidate cached pages so unchanged ones come back as 304 with no body
+        validators = self.cache.validators(source.url) if self.cache else {}
+        request_headers.update(validators)
+        
+        host = urlparse(source.url).hostname or ''
+        retry_forbidden = any(host == fallback_host or host.endswith('.' + fallback_host)
+                              for fallback_host in self.fallback_agent_hosts)
+        
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            await self._wait_for_host(source.url)
+            
+            try:
+                async with session.get(source.url, headers=request_headers, allow_redirects=True) as response:
+                    if attempt < self.max_retries:
+                        if response.status == 403 and retry_forbidden:
+                            # If blocked, try with different user agent
+                            request_headers['User-Agent'] = FALLBACK_USER_AGENT
+                            continue
+                        if response.status in self.retry_statuses:
+                            continue
+                    
+                    response.raise_for_status()
+                    if response.status != 304:
+                        return await self._read_body(response, source)
+                    cached = self.cache.load(source.url) if self.cache else None
+                    if cached is not None:
+                        return cached
+                
+                # The cached body is gone but its validators survived; ask for the full page instead
+                for header in validators:
+                    request_headers.pop(header, None)
+                async with session.get(source.url, headers=request_headers, allow_redirects=True) as response:
+                    response.raise_for_status()
+                    return await self._read_body(response, source)
+            except asyncio.TimeoutError:
+                # A site that used up the whole timeout won't do better on a retry.
+                # Checked first because aiohttp's timeout errors are also connection errors
+                raise
+            except aiohttp.ClientConnectionError:
+                if attempt == self.max_retries:
+                    raise
+    
+    async def _wait_for_host(self, url):
+        """Space out requests to one host without holding up other hosts"""
+        host = urlparse(url).netloc
+        interval = self.host_interval
+        for slow_host, slow_interval in self.slow_host_intervals.items():
+            if host == slow_host or host.endswith('.' + slow_host):
+                interval = max(interval, slow_interval)
+        
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            delay = self._host_next_ok.get(host, 0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._host_next_ok[host] = time.monotonic() + interval
+    
+    async def _read_body(self, response, source):
+        """Read a response body and its declared charset, caching complete 200 OK pages"""
+        # Stream the body and stop once the size cap is reached
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_body_bytes:
+                break
+        content = b''.join(chunks)
         
-        return headlines
+        # Keep the raw bytes; the parser decodes them once using the header charset
+        charset = response.charset
+        if self.cache and response.status == 200 and size < self.max_body_bytes:
+            self.cache.store(source.url, response.headers, content, charset)
+        return content, charset
     
     def stop(self):
-        """Stop the scraping process"""
+        """Stop the scraping process, cancelling any requests in flight"""
         self.is_running = False
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:
+                pass  # The event loop has already finished
 
 
-class ModernTableWidget(QTableWidget):
-    """Custom table widget with modern styling and proper visibility"""
-    def __init__(self):
+class HeadlinesModel(QAbstractTableModel):
+    """Table model that serves cells straight from the headline list"""
+    
+    COLUMNS = Headline._fields
+    HEADERS = ("📰 Title", "🏢 Source", "🕒 Timestamp", "🔗 URL")
+    
+    def __init__(self, headlines):
         super().__init__()
-        self.setStyleSheet("""
-            QTableWidget {
-                background-color: #ffffff;
-                color: #2c3e50;
-                alternate-background-color: #f8f9fa;
-                selection-background-color: #3498db;
-                selection-color: #ffffff;
-                gridline-color: #dee2e6;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                font-size: 12px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QTableWidget::item {
-                padding: 12px 8px;
-                border: none;
-                border-bottom: 1px solid #f1f3f4;
-                color: #2c3e50;
-            }
-            QTableWidget::item:selected {
-                background-color: #3498db;
-                color: #ffffff;
-            }
-            QTableWidget::item:hover {
-                background-color: #e8f4fd;
-                color: #2c3e50;
-            }
-            QHeaderView::section {
-                background-color: #34495e;
-                color: #ffffff;
-                padding: 12px 8px;
-                border: none;
-                border-right: 1px solid #2c3e50;
-                font-weight: 600;
-                font-size: 12px;
-            }
-            QHeaderView::section:hover {
-                background-color: #2c3e50;
-            }
-        """)
+        self.headlines = headlines
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headlines)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        headline = self.headlines[index.row()]
+        column = self.COLUMNS[index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 'timestamp':
+                return display_timestamp(headline.timestamp)
+            return headline[index.column()]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if column == 'title':
+                return headline.title  # Show full title on hover
+            if column == 'url':
+                return "Double-click to open in browser"
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def append_headlines(self, headlines):
+        """Append headlines to the backing list and announce the new rows"""
+        if not headlines:
+            return
+        first = len(self.headlines)
+        self.beginInsertRows(QModelIndex(), first, first + len(headlines) - 1)
+        self.headlines.extend(headlines)
+        self.endInsertRows()
+        
+    def clear(self):
+        """Empty the backing list"""
+        self.beginResetModel()
+        self.headlines.clear()
+        self.endResetModel()
+
+
+class SourceBreakdownProxy(QSortFilterProxyModel):
+    """Sorts the source breakdown by headline count, keeping tied sources in first-seen order"""
+    
+    def lessThan(self, left, right):
+        # Rows just appended have no count yet
+        left_count = left.data(self.sortRole()) or 0
+        right_count = right.data(self.sortRole()) or 0
+        if left_count != right_count:
+            return left_count < right_count
+        # Source rows are appended as sources first appear. The view sorts in
+        # descending order, so the later source has to compare as the smaller one
+        return left.row() > right.row()
+
+
+# Window stylesheet, shipped next to this script
+THEME_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'theme.qss')
+
+# Exports written piece by piece collect this much before each trip to the disk
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+
+def json_bytes(data, depth=0):
+    """Serialize data as two-space indented UTF-8 JSON, nested depth levels deep"""
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    # Encoded strings never contain raw newlines, so every newline starts a new line of output
+    return encoded.replace(b'\n', b'\n' + b'  ' * depth) if depth else encoded
+
+# Results summary label states. The label is only restyled when it switches
+# between them, so Qt doesn't re-parse the stylesheet on every refresh
+RESULTS_INFO_EMPTY_TEXT = "No headlines scraped yet. Use the Scraper tab to get started."
+RESULTS_INFO_EMPTY_STYLE = """
+    color: #7f8c8d;
+    font-size: 12px;
+    font-style: italic;
+    padding: 10px;
+    background-color: #f8f9fa;
+    border-radius: 6px;
+    border-left: 4px solid #3498db;
+"""
+RESULTS_INFO_READY_STYLE = """
+    color: #27ae60;
+    font-size: 12px;
+    font-weight: 500;
+    padding: 10px;
+    background-color: #d5f4e6;
+    border-radius: 6px;
+    border-left: 4px solid #27ae60;
+"""
 
 
 class NewsScraperApp(QMainWindow):
     """Main application window"""
+    # URL test output is emitted from the test's worker thread and applied on the GUI thread
+    test_log = pyqtSignal(str)
+    test_finished = pyqtSignal()
     
     def __init__(self):
         super().__init__()
         self.headlines = []
+        self.headlines_model = HeadlinesModel(self.headlines)
+        self.scraped_count = 0  # Headlines received during the current scrape
+        self._source_counter = Counter()  # Headlines per source, kept in step with self.headlines
+        self._source_last_ts = {}  # Newest headline timestamp per source
+        self._seen_headlines = set()  # (url, title) of every headline in self.headlines
+        self._changed_sources = {}  # Sources whose analytics row is out of date, in first-seen order
+        self._source_tree_content_key = None  # Sources and count width the tree was last sized for
+        self._results_info_style = None  # Stylesheet currently applied to results_info
+        self._export_stamp = (0, '')  # (epoch second, formatted stamp) for default export filenames
+        
+        # Incoming rows and live preview text are buffered and flushed at most every 100 ms
+        self._pending_headlines = []
+        self._live_buffer = []
+        self._live_timer = QTimer(self, singleShot=True, interval=100)
+        self._live_timer.timeout.connect(self._flush_live)
         self.scraper_thread = None
         self.settings = QSettings('NewsScraperApp', 'Settings')
+        self.response_cache = ResponseCache(os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation), 'responses'))
+        self.parse_pool = None  # Parser worker processes, started with the first scrape
         
         # Define news sources
         self.news_sources = [
@@ -371,42 +805,15 @@ class NewsScraperApp(QMainWindow):
         
         # Create tab widget for different sections
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #dee2e6;
-                border-radius: 10px;
-                background-color: #ffffff;
-                padding: 5px;
-            }
-            QTabBar::tab {
-                background-color: #f8f9fa;
-                color: #495057;
-                padding: 12px 24px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 100px;
-                border: 1px solid #dee2e6;
-                border-bottom: none;
-            }
-            QTabBar::tab:selected {
-                background-color: #3498db;
-                color: #ffffff;
-                border-color: #3498db;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #e9ecef;
-                color: #343a40;
-            }
-        """)
+        self.tab_widget.setObjectName("mainTabs")
         
-        # Create tabs
+        # Create tabs. Settings and Analytics are only built once they are first opened
+        self._lazy_tabs = {}
         self.create_scraper_tab()
         self.create_results_tab()
-        self.create_settings_tab()
-        self.create_analytics_tab()
+        self.add_lazy_tab(self.create_settings_tab, "⚙️ Settings")
+        self.add_lazy_tab(self.create_analytics_tab, "📈 Analytics")
+        self.tab_widget.currentChanged.connect(self.ensure_tab_built)
         
         main_layout.addWidget(self.tab_widget)
         
@@ -439,298 +846,15 @@ class NewsScraperApp(QMainWindow):
         font = QFont("Segoe UI", 10)
         self.setFont(font)
         
-        # Apply comprehensive professional stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f8f9fa;
-                color: #2c3e50;
-            }
-            
-            QWidget {
-                color: #2c3e50;
-                background-color: transparent;
-            }
-            
-            QLabel {
-                color: #2c3e50;
-                font-size: 12px;
-                font-weight: 500;
-                padding: 4px 2px;
-            }
-            
-            QPushButton {
-                background-color: #3498db;
-                color: #ffffff;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 13px;
-                min-width: 120px;
-                min-height: 40px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-                transform: translateY(-1px);
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-                transform: translateY(0px);
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }
-            
-            QPushButton#danger {
-                background-color: #e74c3c;
-            }
-            QPushButton#danger:hover {
-                background-color: #c0392b;
-            }
-            
-            QPushButton#success {
-                background-color: #27ae60;
-            }
-            QPushButton#success:hover {
-                background-color: #229954;
-            }
-            
-            QPushButton#warning {
-                background-color: #f39c12;
-                color: #ffffff;
-            }
-            QPushButton#warning:hover {
-                background-color: #e67e22;
-            }
-            
-            QGroupBox {
-                font-weight: 600;
-                font-size: 14px;
-                border: 2px solid #dee2e6;
-                border-radius: 10px;
-                margin-top: 20px;
-                padding-top: 15px;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 10px 0 10px;
-                color: #34495e;
-                font-weight: 600;
-                font-size: 14px;
-                background-color: #ffffff;
-            }
-            
-            QComboBox {
-                background-color: #ffffff;
-                color: #2c3e50;
-                border: 2px solid #dee2e6;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 12px;
-                min-height: 25px;
-            }
-            QComboBox:hover {
-                border-color: #3498db;
-            }
-            QComboBox:focus {
-                border-color: #3498db;
-                outline: none;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 25px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #7f8c8d;
-                width: 0;
-                height: 0;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #ffffff;
-                color: #2c3e50;
-                selection-background-color: #3498db;
-                selection-color: #ffffff;
-                border: 2px solid #dee2e6;
-                border-radius: 6px;
-            }
-            
-            QLineEdit {
-                background-color: #ffffff;
-                color: #2c3e50;
-                border: 2px solid #dee2e6;
-                border-radius: 6px;
-                padding: 10px 12px;
-                font-size: 12px;
-                min-height: 20px;
-            }
-            QLineEdit:focus {
-                border-color: #3498db;
-                outline: none;
-            }
-            QLineEdit:hover {
-                border-color: #bdc3c7;
-            }
-            
-            QSpinBox {
-                background-color: #ffffff;
-                color: #2c3e50;
-                border: 2px solid #dee2e6;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 12px;
-                min-height: 25px;
-            }
-            QSpinBox:focus {
-                border-color: #3498db;
-            }
-            QSpinBox:hover {
-                border-color: #bdc3c7;
-            }
-            
-            QCheckBox {
-                color: #2c3e50;
-                font-size: 12px;
-                font-weight: 500;
-                spacing: 10px;
-                padding: 5px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #dee2e6;
-                border-radius: 4px;
-                background-color: #ffffff;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #3498db;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #3498db;
-                border-color: #3498db;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTQiIGhlaWdodD0iMTQiIHZpZXdCb3g9IjAgMCAxNCAxNCIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTExLjY2NjcgMy41TDUuMjUgOS45MTY2N0wyLjMzMzM0IDciIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-            }
-            
-            QTextEdit {
-                background-color: #ffffff;
-                color: #2c3e50;
-                border: 2px solid #dee2e6;
-                border-radius: 8px;
-                padding: 12px;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 11px;
-                line-height: 1.5;
-            }
-            QTextEdit:focus {
-                border-color: #3498db;
-            }
-            
-            QProgressBar {
-                background-color: #ecf0f1;
-                border: 2px solid #dee2e6;
-                border-radius: 10px;
-                height: 25px;
-                text-align: center;
-                color: #2c3e50;
-                font-weight: 600;
-                font-size: 12px;
-            }
-            QProgressBar::chunk {
-                background-color: #3498db;
-                border-radius: 8px;
-            }
-            
-            QStatusBar {
-                background-color: #ffffff;
-                color: #2c3e50;
-                border-top: 1px solid #dee2e6;
-                font-size: 11px;
-                padding: 5px;
-            }
-            
-            QTreeWidget {
-                background-color: #ffffff;
-                color: #2c3e50;
-                alternate-background-color: #f8f9fa;
-                selection-background-color: #3498db;
-                selection-color: #ffffff;
-                border: 2px solid #dee2e6;
-                border-radius: 8px;
-                font-size: 12px;
-            }
-            QTreeWidget::item {
-                padding: 8px;
-                border: none;
-                border-bottom: 1px solid #f1f3f4;
-            }
-            QTreeWidget::item:selected {
-                background-color: #3498db;
-                color: #ffffff;
-            }
-            QTreeWidget::item:hover:!selected {
-                background-color: #e8f4fd;
-            }
-            QHeaderView::section {
-                background-color: #34495e;
-                color: #ffffff;
-                padding: 10px;
-                border: none;
-                border-right: 1px solid #2c3e50;
-                font-weight: 600;
-                font-size: 12px;
-            }
-            
-            QScrollBar:vertical {
-                background-color: #f8f9fa;
-                width: 14px;
-                border-radius: 7px;
-                margin: 0;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #bdc3c7;
-                border-radius: 7px;
-                min-height: 25px;
-                margin: 2px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #95a5a6;
-            }
-            
-            QScrollBar:horizontal {
-                background-color: #f8f9fa;
-                height: 14px;
-                border-radius: 7px;
-                margin: 0;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: #bdc3c7;
-                border-radius: 7px;
-                min-width: 25px;
-                margin: 2px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: #95a5a6;
-            }
-        """)
+        # Apply the professional stylesheet for every widget in the window at once
+        with open(THEME_PATH, encoding='utf-8') as f:
+            self.setStyleSheet(f.read())
         
     def create_header(self, layout):
         """Create application header with title and logo"""
         header_frame = QFrame()
         header_frame.setFixedHeight(90)
-        header_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 #2c3e50, stop:1 #34495e);
-                border-radius: 12px;
-                margin-bottom: 10px;
-            }
-        """)
+        header_frame.setObjectName("appHeader")
         
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(25, 15, 25, 15)
@@ -740,33 +864,17 @@ class NewsScraperApp(QMainWindow):
         
         # Icon
         icon_label = QLabel("📰")
-        icon_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 32px;
-            margin-right: 15px;
-        """)
+        icon_label.setObjectName("headerIcon")
         
         # Title and subtitle
         title_layout = QVBoxLayout()
         title_layout.setSpacing(2)
         
         title_label = QLabel("NewsVision")
-        title_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 24px;
-            font-weight: 700;
-            margin: 0;
-            padding: 0;
-        """)
+        title_label.setObjectName("headerTitle")
         
         subtitle_label = QLabel("Advanced web scraping tool for news aggregation")
-        subtitle_label.setStyleSheet("""
-            color: #bdc3c7;
-            font-size: 14px;
-            font-weight: 400;
-            margin: 0;
-            padding: 0;
-        """)
+        subtitle_label.setObjectName("headerSubtitle")
         
         title_layout.addWidget(title_label)
         title_layout.addWidget(subtitle_label)
@@ -779,22 +887,10 @@ class NewsScraperApp(QMainWindow):
         right_layout.setAlignment(Qt.AlignmentFlag.AlignRight)
         
         version_label = QLabel("Version 2.0 Professional")
-        version_label.setStyleSheet("""
-            color: #ecf0f1;
-            font-size: 14px;
-            font-weight: 600;
-            margin: 0;
-            padding: 0;
-        """)
+        version_label.setObjectName("headerVersion")
         
         status_label = QLabel("Ready for scraping")
-        status_label.setStyleSheet("""
-            color: #2ecc71;
-            font-size: 12px;
-            font-weight: 500;
-            margin: 0;
-            padding: 0;
-        """)
+        status_label.setObjectName("headerStatus")
         
         right_layout.addWidget(version_label)
         right_layout.addWidget(status_label)
@@ -819,7 +915,7 @@ class NewsScraperApp(QMainWindow):
         
         # Source selection
         source_label = QLabel("News Sources:")
-        source_label.setStyleSheet("font-weight: 600; color: #34495e;")
+        source_label.setObjectName("fieldLabel")
         control_layout.addWidget(source_label, 0, 0)
         
         self.source_combo = QComboBox()
@@ -830,7 +926,7 @@ class NewsScraperApp(QMainWindow):
         
         # Max headlines
         headlines_label = QLabel("Max Headlines per Source:")
-        headlines_label.setStyleSheet("font-weight: 600; color: #34495e;")
+        headlines_label.setObjectName("fieldLabel")
         control_layout.addWidget(headlines_label, 1, 0)
         
         self.max_headlines_spin = QSpinBox()
@@ -840,7 +936,7 @@ class NewsScraperApp(QMainWindow):
         
         # Custom URL input
         custom_label = QLabel("Custom URL:")
-        custom_label.setStyleSheet("font-weight: 600; color: #34495e;")
+        custom_label.setObjectName("fieldLabel")
         control_layout.addWidget(custom_label, 2, 0)
         
         self.custom_url_input = QLineEdit()
@@ -874,23 +970,7 @@ class NewsScraperApp(QMainWindow):
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                background-color: #ecf0f1;
-                border: 2px solid #dee2e6;
-                border-radius: 12px;
-                height: 30px;
-                text-align: center;
-                color: #2c3e50;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                    stop:0 #3498db, stop:1 #2980b9);
-                border-radius: 10px;
-            }
-        """)
+        self.progress_bar.setObjectName("scrapeProgress")
         control_layout.addWidget(self.progress_bar, 4, 0, 1, 2)
         
         layout.addWidget(control_group)
@@ -904,21 +984,7 @@ class NewsScraperApp(QMainWindow):
         self.live_results.setMaximumHeight(200)
         self.live_results.setReadOnly(True)
         self.live_results.setPlaceholderText("Live headlines will appear here during scraping...")
-        self.live_results.setStyleSheet("""
-            QTextEdit {
-                background-color: #ffffff;
-                color: #2c3e50;
-                border: 2px solid #dee2e6;
-                border-radius: 10px;
-                padding: 15px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 12px;
-                line-height: 1.6;
-            }
-            QTextEdit:focus {
-                border-color: #3498db;
-            }
-        """)
+        self.live_results.setObjectName("livePreview")
         preview_layout.addWidget(self.live_results)
         
         layout.addWidget(preview_group)
@@ -959,21 +1025,17 @@ class NewsScraperApp(QMainWindow):
         results_layout.setContentsMargins(20, 25, 20, 20)
         
         # Results info
-        self.results_info = QLabel("No headlines scraped yet. Use the Scraper tab to get started.")
-        self.results_info.setStyleSheet("""
-            color: #7f8c8d;
-            font-size: 12px;
-            font-style: italic;
-            padding: 10px;
-            background-color: #f8f9fa;
-            border-radius: 6px;
-            border-left: 4px solid #3498db;
-        """)
+        self.results_info = QLabel()
+        self.set_results_info(RESULTS_INFO_EMPTY_TEXT, RESULTS_INFO_EMPTY_STYLE)
         results_layout.addWidget(self.results_info)
         
-        self.results_table = ModernTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels(["📰 Title", "🏢 Source", "🕒 Timestamp", "🔗 URL"])
+        # Sort through a proxy so the underlying headline order stays intact
+        self.results_proxy = QSortFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.headlines_model)
+        
+        self.results_table = QTableView()
+        self.results_table.setObjectName("resultsTable")
+        self.results_table.setModel(self.results_proxy)
         
         # Set column widths
         header = self.results_table.horizontalHeader()
@@ -984,20 +1046,32 @@ class NewsScraperApp(QMainWindow):
         
         # Enable sorting and selection
         self.results_table.setSortingEnabled(True)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.results_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.results_table.setAlternatingRowColors(True)
         
         # Double-click to open URL
-        self.results_table.cellDoubleClicked.connect(self.open_url)
+        self.results_table.doubleClicked.connect(self.open_url)
         
         results_layout.addWidget(self.results_table)
         layout.addWidget(results_group)
         
         self.tab_widget.addTab(results_widget, "📊 Results")
         
-    def create_settings_tab(self):
+    def add_lazy_tab(self, builder, label):
+        """Add an empty tab that builder(widget) fills in the first time it is shown"""
+        placeholder = QWidget()
+        self._lazy_tabs[placeholder] = builder
+        self.tab_widget.addTab(placeholder, label)
+        
+    def ensure_tab_built(self, index):
+        """Build a lazily created tab's contents if they don't exist yet"""
+        widget = self.tab_widget.widget(index)
+        builder = self._lazy_tabs.pop(widget, None)
+        if builder:
+            builder(widget)
+        
+    def create_settings_tab(self, settings_widget):
         """Create settings configuration tab"""
-        settings_widget = QWidget()
         layout = QVBoxLayout(settings_widget)
         layout.setSpacing(20)
         
@@ -1011,7 +1085,7 @@ class NewsScraperApp(QMainWindow):
         refresh_layout.addWidget(self.auto_refresh_check, 0, 0, 1, 1)
         
         interval_label = QLabel("Refresh Interval (minutes):")
-        interval_label.setStyleSheet("font-weight: 600; color: #34495e;")
+        interval_label.setObjectName("fieldLabel")
         refresh_layout.addWidget(interval_label, 1, 0)
         
         self.refresh_interval_spin = QSpinBox()
@@ -1039,7 +1113,7 @@ class NewsScraperApp(QMainWindow):
         advanced_layout.setSpacing(0)  #15
         
         timeout_label = QLabel("Request Timeout (seconds):")
-        timeout_label.setStyleSheet("font-weight: 600; color: black; padding: 1px; background-color: white ;")
+        timeout_label.setObjectName("timeoutLabel")
         advanced_layout.addWidget(timeout_label, 0, 0)
 
         
@@ -1049,7 +1123,7 @@ class NewsScraperApp(QMainWindow):
         advanced_layout.addWidget(self.timeout_spin, 0, 1)
         
         delay_label = QLabel("Delay between requests (seconds):")
-        delay_label.setStyleSheet("font-weight: 600; color: white; padding: 1px; background-color: white;")
+        delay_label.setObjectName("delayLabel")
         advanced_layout.addWidget(delay_label, 1, 0) #11
         
         self.delay_spin = QSpinBox()
@@ -1068,22 +1142,12 @@ class NewsScraperApp(QMainWindow):
         
         # Test URL section
         test_section = QFrame()
-        test_section.setStyleSheet("""
-            QFrame {
-                background-color: #f0f8ff;
-                
-                
-                padding: 0px;
-                width: 100%;
-                length: 100%;
-                                   
-            }
-        """)
+        test_section.setObjectName("testSection")
         test_layout = QVBoxLayout(test_section)
         
         test_url_layout = QHBoxLayout()
         test_url_label = QLabel("Test URL:")
-        test_url_label.setStyleSheet("font-weight: 600; color: #34495e; min-width: 40px; padding: 1px; ")
+        test_url_label.setObjectName("testUrlLabel")
         
         self.test_url_input = QLineEdit()
         self.test_url_input.setPlaceholderText("Enter URL to test (e.g., https://indianexpress.com/section/india/)")
@@ -1098,24 +1162,15 @@ class NewsScraperApp(QMainWindow):
         
         # Test results
         results_label = QLabel("Test Results:")
-        results_label.setStyleSheet("font-weight: 600; color: #34495e; margin-top: 10px;")
+        results_label.setObjectName("testResultsLabel")
         
         self.test_results = QTextEdit()
         self.test_results.setMaximumHeight(150)
         self.test_results.setReadOnly(True)
         self.test_results.setPlaceholderText("Test results will appear here...")
-        self.test_results.setStyleSheet("""
-            QTextEdit {
-                background-color: #ffffff;
-                color: #2c3e50;
-                border: 2px solid #dee2e6;
-                border-radius: 6px;
-                padding: 2px;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 11px;
-                line-height: 1.4;
-            }
-        """)
+        self.test_results.setObjectName("testResults")
+        self.test_log.connect(self.test_results.append)
+        self.test_finished.connect(self.url_test_finished)
         
         test_layout.addLayout(test_url_layout)
         test_layout.addWidget(results_label)
@@ -1125,18 +1180,11 @@ class NewsScraperApp(QMainWindow):
         
         # Tips section
         tips_section = QFrame()
-        tips_section.setStyleSheet("""
-            QFrame {
-                background-color: #e8f4fd;
-                border: 1px solid #3498db;
-                border-radius: 8px;
-                padding: 2px;
-            }
-        """)
+        tips_section.setObjectName("tipsSection")
         tips_layout = QVBoxLayout(tips_section)
         
         tips_title = QLabel("💡 Common Issues & Solutions")
-        tips_title.setStyleSheet("font-weight: 600; color: #2980b9; font-size: 14px; margin-bottom: 10px; padding-left: 2px;")
+        tips_title.setObjectName("tipsTitle")
         
         tips_text = QLabel("""
         • <b>403 Forbidden:</b> Website blocks bots - try VPN or different browser headers<br>
@@ -1146,12 +1194,7 @@ class NewsScraperApp(QMainWindow):
         • <b>Rate Limiting:</b> Increase delay between requests to avoid being blocked
         """)
         tips_text.setWordWrap(True)
-        tips_text.setStyleSheet("""
-            color: #2c3e50; 
-            font-size: 12px; 
-            line-height: 1.5;
-            background-color: #ffffff;
-        """)
+        tips_text.setObjectName("tipsText")
         
         tips_layout.addWidget(tips_title)
         tips_layout.addWidget(tips_text)
@@ -1162,25 +1205,19 @@ class NewsScraperApp(QMainWindow):
         
         # Save settings button
         save_settings_btn = QPushButton("💾 Save Settings")
-        save_settings_btn.setObjectName("success")
+        save_settings_btn.setObjectName("saveSettings")
         save_settings_btn.clicked.connect(self.save_settings)
-        save_settings_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 14px;
-                font-weight: 600;
-                padding: 12px 30px;
-                margin: 10px 0;
-            }
-        """)
         layout.addWidget(save_settings_btn)
         
         layout.addStretch()
         
-        self.tab_widget.addTab(settings_widget, "⚙️ Settings")
+        try:
+            self.load_settings_tab()
+        except Exception as e:
+            print(f"Error loading settings: {e}")
         
-    def create_analytics_tab(self):
+    def create_analytics_tab(self, analytics_widget):
         """Create analytics and statistics tab"""
-        analytics_widget = QWidget()
         layout = QVBoxLayout(analytics_widget)
         layout.setSpacing(20)
         
@@ -1203,34 +1240,34 @@ class NewsScraperApp(QMainWindow):
         breakdown_layout = QVBoxLayout(breakdown_group)
         breakdown_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.source_tree = QTreeWidget()
-        self.source_tree.setHeaderLabels(["📰 Source", "📊 Headlines Count", "🕒 Last Updated"])
+        # One row per source, updated in place; the proxy keeps the busiest sources on top
+        self.source_model = QStandardItemModel(0, 3, self)
+        self.source_model.setHorizontalHeaderLabels(["📰 Source", "📊 Headlines Count", "🕒 Last Updated"])
+        self._source_items = {}  # Source name -> (count item, last updated item)
+        self._changed_sources.update(dict.fromkeys(self._source_counter))
+        
+        self.source_proxy = SourceBreakdownProxy(self)
+        self.source_proxy.setSourceModel(self.source_model)
+        self.source_proxy.setSortRole(Qt.ItemDataRole.UserRole)
+        self.source_proxy.sort(1, Qt.SortOrder.DescendingOrder)
+        
+        self.source_tree = QTreeView()
+        self.source_tree.setModel(self.source_proxy)
         self.source_tree.setRootIsDecorated(False)
         self.source_tree.setAlternatingRowColors(True)
+        self.source_tree.setEditTriggers(QTreeView.EditTrigger.NoEditTriggers)
         breakdown_layout.addWidget(self.source_tree)
         
         layout.addWidget(breakdown_group)
         
         layout.addStretch()
         
-        self.tab_widget.addTab(analytics_widget, "📈 Analytics")
+        self.update_analytics()
         
     def create_stat_card(self, layout, attr_name, icon, title, value, row, col):
         """Create a statistics card widget"""
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border: 2px solid #dee2e6;
-                border-radius: 10px;
-                padding: 15px;
-                color: black;
-            }
-            QFrame:hover {
-                border-color: #3498db;
-                transform: translateY(-2px);
-            }
-        """)
+        card.setObjectName("statCard")
         card.setFixedHeight(120)
         
         card_layout = QVBoxLayout(card)
@@ -1240,10 +1277,10 @@ class NewsScraperApp(QMainWindow):
         header_layout = QHBoxLayout()
         
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 24px; color: #3498db;")
+        icon_label.setObjectName("statIcon")
         
         title_label = QLabel(title)
-        title_label.setStyleSheet("font-size: 12px; font-weight: 600; color: #7f8c8d;")
+        title_label.setObjectName("statTitle")
         
         header_layout.addWidget(icon_label)
         header_layout.addWidget(title_label)
@@ -1251,12 +1288,7 @@ class NewsScraperApp(QMainWindow):
         
         # Value
         value_label = QLabel(value)
-        value_label.setStyleSheet("""
-            font-size: 20px; 
-            font-weight: 700; 
-            color: #2c3e50; 
-            margin-top: 5px;
-        """)
+        value_label.setObjectName("statValue")
         
         # Store reference to update later
         setattr(self, f"{attr_name}_label", value_label)
@@ -1271,16 +1303,7 @@ class NewsScraperApp(QMainWindow):
         """Create status bar with information"""
         self.status_bar = QStatusBar()
         self.status_bar.showMessage("Ready to scrape news headlines...")
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background-color: #ffffff;
-                color: #2c3e50;
-                border-top: 2px solid #dee2e6;
-                font-size: 12px;
-                font-weight: 500;
-                padding: 8px 15px;
-            }
-        """)
+        self.status_bar.setObjectName("appStatusBar")
         self.setStatusBar(self.status_bar)
         
     def start_scraping(self):
@@ -1300,7 +1323,8 @@ class NewsScraperApp(QMainWindow):
         custom_url = self.custom_url_input.text().strip()
         if custom_url:
             custom_source = NewsSource("Custom URL", custom_url, 
-                                     ["h1", "h2", "h3", ".headline", ".title", "article h2", "article h3"])
+                                     ["h1", "h2", "h3", ".headline", ".title", "article h2", "article h3"],
+                                     use_fallback_selectors=True)
             selected_sources.append(custom_source)
         
         if not selected_sources:
@@ -1318,13 +1342,31 @@ class NewsScraperApp(QMainWindow):
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         
+        # Hold off measuring column contents until the scrape is done
+        self.set_results_autosize(False)
+        
+        # A pool that lost a worker refuses all further work, so replace it
+        if self.parse_pool is not None and self.scraper_thread is not None and self.scraper_thread.parse_pool_broken:
+            self.parse_pool.shutdown(wait=False, cancel_futures=True)
+            self.parse_pool = None
+        
+        # Parser workers are spawned fresh rather than forked from this
+        # multi-threaded Qt process, and only once something is scraped
+        if self.parse_pool is None:
+            self.parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                                  mp_context=multiprocessing.get_context('spawn'))
+        
         # Start scraping thread
+        self.scraped_count = 0
         max_headlines = self.max_headlines_spin.value()
-        self.scraper_thread = ScraperThread(selected_sources, max_headlines)
+        self.scraper_thread = ScraperThread(selected_sources, max_headlines,
+                                            cache=self.response_cache, parse_pool=self.parse_pool,
+                                            timeout=self.setting('timeout_spin', 'request_timeout', 10),
+                                            delay=self.setting('delay_spin', 'request_delay', 1))
         
         # Connect signals
         self.scraper_thread.progress_update.connect(self.progress_bar.setValue)
-        self.scraper_thread.headline_found.connect(self.add_headline_live)
+        self.scraper_thread.headlines_batch.connect(self.add_headlines)
         self.scraper_thread.finished_scraping.connect(self.scraping_finished)
         self.scraper_thread.error_occurred.connect(self.show_error)
         
@@ -1333,37 +1375,83 @@ class NewsScraperApp(QMainWindow):
         
     def stop_scraping(self):
         """Stop the scraping process"""
-        if self.scraper_thread:
+        if self.scraper_thread and self.scraper_thread.isRunning():
+            # The thread winds down on its own and reports back through scraping_finished
             self.scraper_thread.stop()
-            self.scraper_thread.wait()
+            self.stop_btn.setEnabled(False)
+            self.status_bar.showMessage("⏹️ Stopping scraping...")
             
-        self.scrape_btn.setEnabled(True)
-        self.scrape_btn.setText("🚀 Start Scraping")
-        self.stop_btn.setEnabled(False)
-        self.progress_bar.setVisible(False)
-        self.status_bar.showMessage("⏹️ Scraping stopped by user")
-        
-    def add_headline_live(self, headline):
-        """Add headline to live results preview with better formatting"""
+    def set_results_autosize(self, enabled):
+        """Toggle content-based sizing of the narrow results columns"""
+        mode = QHeaderView.ResizeMode.ResizeToContents if enabled else QHeaderView.ResizeMode.Interactive
+        header = self.results_table.horizontalHeader()
+        for column in (1, 2, 3):
+            header.setSectionResizeMode(column, mode)
+        
+    def add_headlines(self, headlines):
+        """Collect a batch of headlines sent by the scraper thread, skipping ones already listed"""
+        # Headlines without a link all point at their source page, so the title
+        # is part of the key to keep them apart
+        new_headlines = []
+        for headline in headlines:
+            key = (headline.url, headline.title)
+            if key not in self._seen_headlines:
+                self._seen_headlines.add(key)
+                new_headlines.append(headline)
+        if not new_headlines:
+            return
+        headlines = new_headlines
+        
+        for headline in headlines:
+            source = headline.source
+            self._changed_sources[source] = None
+            self._source_counter[source] += 1
+            self._source_last_ts[source] = max(self._source_last_ts.get(source, ''), headline.timestamp)
+        self._pending_headlines.extend(headlines)
+        self.scraped_count += len(headlines)
+        self.add_headlines_live(headlines)
+        
+    def add_headlines_live(self, headlines):
+        """Queue a batch of headlines for the live results preview"""
         timestamp = datetime.now().strftime('%H:%M:%S')
-        formatted_text = f"[{timestamp}] 🏢 {headline['source']}\n📰 {headline['title']}\n{'─' * 50}\n"
-        self.live_results.append(formatted_text)
+        self._live_buffer.extend(
+            f"[{timestamp}] 🏢 {headline.source}\n📰 {headline.title}\n{'─' * 50}\n"
+            for headline in headlines
+        )
+        if not self._live_timer.isActive():
+            self._live_timer.start()
+            
+    def _flush_live(self):
+        """Append all queued headlines to the results table and live preview at once"""
+        if self._pending_headlines:
+            # One row insertion for everything received since the last flush
+            self.headlines_model.append_headlines(self._pending_headlines)
+            self._pending_headlines = []
+        
+        if not self._live_buffer:
+            return
+        self.live_results.append("\n".join(self._live_buffer))
+        self._live_buffer.clear()
         
         # Auto-scroll to bottom
         cursor = self.live_results.textCursor()
         cursor.movePosition(cursor.MoveOperation.End)
         self.live_results.setTextCursor(cursor)
         
-    def scraping_finished(self, headlines):
+    def scraping_finished(self):
         """Handle scraping completion"""
-        self.headlines.extend(headlines)
-        
         # Reset UI
         self.scrape_btn.setEnabled(True)
         self.scrape_btn.setText("🚀 Start Scraping")
         self.stop_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
         
+        # Take in whatever arrived since the last flush
+        self._flush_live()
+        
+        # Size the columns once, now that no more batches are coming
+        self.set_results_autosize(True)
+        
         # Update results table
         self.update_results_table()
         
@@ -1371,57 +1459,38 @@ class NewsScraperApp(QMainWindow):
         self.update_analytics()
         
         # Show completion message
-        message = f"✅ Scraping completed! Found {len(headlines)} new headlines."
+        if self.scraper_thread and not self.scraper_thread.is_running:
+            message = f"⏹️ Scraping stopped by user. Found {self.scraped_count} new headlines."
+        else:
+            message = f"✅ Scraping completed! Found {self.scraped_count} new headlines."
         self.status_bar.showMessage(message)
         
         # Update live results
         self.live_results.append(f"\n🎉 {message}")
         
         # Auto-save if enabled
-        if hasattr(self, 'auto_save_check') and self.auto_save_check.isChecked():
+        if self.setting('auto_save_check', 'auto_save_enabled', False):
             self.export_to_txt(auto_save=True)
             
     def update_results_table(self):
-        """Update the results table with current headlines"""
-        self.results_table.setRowCount(len(self.headlines))
-        
-        for row, headline in enumerate(self.headlines):
-            # Title
-            title_item = QTableWidgetItem(headline['title'])
-            title_item.setToolTip(headline['title'])  # Show full title on hover
-            self.results_table.setItem(row, 0, title_item)
-            
-            # Source
-            source_item = QTableWidgetItem(headline['source'])
-            self.results_table.setItem(row, 1, source_item)
-            
-            # Timestamp
-            timestamp_item = QTableWidgetItem(headline['timestamp'])
-            self.results_table.setItem(row, 2, timestamp_item)
-            
-            # URL
-            url_item = QTableWidgetItem(headline['url'])
-            url_item.setToolTip("Double-click to open in browser")
-            self.results_table.setItem(row, 3, url_item)
-        
+        """Update the results summary; rows are inserted as batches arrive"""
         # Update results info
         total_headlines = len(self.headlines)
-        unique_sources = len(set(h['source'] for h in self.headlines))
+        unique_sources = len(self._source_counter)
         
         if total_headlines > 0:
-            self.results_info.setText(
+            self.set_results_info(
                 f"📊 Showing {total_headlines} headlines from {unique_sources} sources. "
-                f"Double-click any row to open the article in your browser."
+                f"Double-click any row to open the article in your browser.",
+                RESULTS_INFO_READY_STYLE
             )
-            self.results_info.setStyleSheet("""
-                color: #27ae60;
-                font-size: 12px;
-                font-weight: 500;
-                padding: 10px;
-                background-color: #d5f4e6;
-                border-radius: 6px;
-                border-left: 4px solid #27ae60;
-            """)
+        
+    def set_results_info(self, text, style):
+        """Update the results summary label, restyling it only when the style changes"""
+        self.results_info.setText(text)
+        if style is not self._results_info_style:
+            self._results_info_style = style
+            self.results_info.setStyleSheet(style)
         
     def update_analytics(self):
         """Update analytics display with better formatting"""
@@ -1429,7 +1498,7 @@ class NewsScraperApp(QMainWindow):
             return
             
         total_headlines = len(self.headlines)
-        unique_sources = len(set(h['source'] for h in self.headlines))
+        unique_sources = len(self._source_counter)
         last_scrape = datetime.now().strftime('%Y-%m-%d %H:%M:%S') if self.headlines else "Never"
         
         # Calculate success rate (dummy calculation for now)
@@ -1440,28 +1509,35 @@ class NewsScraperApp(QMainWindow):
         self.last_scrape_label.setText(last_scrape)
         self.success_rate_label.setText(f"{success_rate:.0f}%")
         
-        # Update source tree
-        self.source_tree.clear()
-        source_counts = {}
-        for headline in self.headlines:
-            source = headline['source']
-            if source not in source_counts:
-                source_counts[source] = {'count': 0, 'last_updated': headline['timestamp']}
-            source_counts[source]['count'] += 1
-            if headline['timestamp'] > source_counts[source]['last_updated']:
-                source_counts[source]['last_updated'] = headline['timestamp']
-        
-        # Sort by count (descending)
-        sorted_sources = sorted(source_counts.items(), key=lambda x: x[1]['count'], reverse=True)
-        
-        for source, data in sorted_sources:
-            item = QTreeWidgetItem([source, f"{data['count']:,}", data['last_updated']])
-            self.source_tree.addTopLevelItem(item)
-        
-        # Resize columns to content
-        self.source_tree.resizeColumnToContents(0)
-        self.source_tree.resizeColumnToContents(1)
-        self.source_tree.resizeColumnToContents(2)
+        # Update source tree, touching only the sources that gained headlines
+        self.source_tree.setUpdatesEnabled(False)
+        if not self._source_counter:
+            self.source_model.removeRows(0, self.source_model.rowCount())
+            self._source_items.clear()
+        
+        for source in self._changed_sources:
+            items = self._source_items.get(source)
+            if items is None:
+                row = [QStandardItem(source), QStandardItem(), QStandardItem()]
+                self.source_model.appendRow(row)
+                items = self._source_items[source] = (row[1], row[2])
+            
+            count_item, updated_item = items
+            count = self._source_counter[source]
+            count_item.setData(count, Qt.ItemDataRole.UserRole)  # Sort key
+            count_item.setText(f"{count:,}")
+            updated_item.setText(display_timestamp(self._source_last_ts[source]))
+        self._changed_sources.clear()
+        
+        # Resize columns to content only when the widest entries may have changed
+        content_key = (frozenset(self._source_counter),
+                       max((len(f"{count:,}") for count in self._source_counter.values()), default=0))
+        if content_key != self._source_tree_content_key:
+            self._source_tree_content_key = content_key
+            self.source_tree.resizeColumnToContents(0)
+            self.source_tree.resizeColumnToContents(1)
+            self.source_tree.resizeColumnToContents(2)
+        self.source_tree.setUpdatesEnabled(True)
             
     def clear_results(self):
         """Clear all results with confirmation"""
@@ -1474,25 +1550,28 @@ class NewsScraperApp(QMainWindow):
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.headlines.clear()
-            self.results_table.setRowCount(0)
+            self.headlines_model.clear()
+            self._source_counter.clear()
+            self._source_last_ts.clear()
+            self._seen_headlines.clear()
+            self._changed_sources.clear()
+            self._pending_headlines.clear()
+            self._live_buffer.clear()
             self.live_results.clear()
             self.update_analytics()
             
             # Reset results info
-            self.results_info.setText("No headlines scraped yet. Use the Scraper tab to get started.")
-            self.results_info.setStyleSheet("""
-                color: #7f8c8d;
-                font-size: 12px;
-                font-style: italic;
-                padding: 10px;
-                background-color: #f8f9fa;
-                border-radius: 6px;
-                border-left: 4px solid #3498db;
-            """)
+            self.set_results_info(RESULTS_INFO_EMPTY_TEXT, RESULTS_INFO_EMPTY_STYLE)
             
             self.status_bar.showMessage("🗑️ Results cleared successfully")
             
+    def export_filename(self, extension):
+        """Default export filename, formatting the timestamp at most once per second"""
+        second = int(time.time())
+        if second != self._export_stamp[0]:
+            self._export_stamp = (second, datetime.fromtimestamp(second).strftime('%Y%m%d_%H%M%S'))
+        return f"headlines_{self._export_stamp[1]}.{extension}"
+        
     def export_to_txt(self, auto_save=False):
         """Export headlines to text file"""
         if not self.headlines:
@@ -1500,30 +1579,41 @@ class NewsScraperApp(QMainWindow):
             return
             
         if auto_save:
-            filename = f"headlines_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            filename = self.export_filename('txt')
             filepath = os.path.join(os.getcwd(), filename)
         else:
             filepath, _ = QFileDialog.getSaveFileName(
-                self, "Save Headlines", f"headlines_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                self, "Save Headlines", self.export_filename('txt'),
                 "Text Files (*.txt)")
             
         if filepath:
             try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write("=" * 80 + "\n")
-                    f.write("PROFESSIONAL NEWS HEADLINES SCRAPER - EXPORT REPORT\n")
-                    f.write("=" * 80 + "\n")
-                    f.write(f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Total Headlines: {len(self.headlines)}\n")
-                    f.write(f"Unique Sources: {len(set(h['source'] for h in self.headlines))}\n")
-                    f.write("=" * 80 + "\n\n")
-                    
-                    for i, headline in enumerate(self.headlines, 1):
-                        f.write(f"[{i:03d}] {headline['title']}\n")
-                        f.write(f"      Source: {headline['source']}\n")
-                        f.write(f"      Time: {headline['timestamp']}\n")
-                        f.write(f"      URL: {headline['url']}\n")
-                        f.write("-" * 80 + "\n\n")
+                report = [
+                    "=" * 80,
+                    "PROFESSIONAL NEWS HEADLINES SCRAPER - EXPORT REPORT",
+                    "=" * 80,
+                    f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                    f"Total Headlines: {len(self.headlines)}",
+                    f"Unique Sources: {len(self._source_counter)}",
+                    "=" * 80 + "\n\n",
+                ]
+                header = "\n".join(report)
+                separator = "-" * 80
+                body = "".join(
+                    f"[{i:03d}] {headline.title}\n"
+                    f"      Source: {headline.source}\n"
+                    f"      Time: {headline.timestamp}\n"
+                    f"      URL: {headline.url}\n"
+                    f"{separator}\n\n"
+                    for i, headline in enumerate(self.headlines, 1)
+                )
+                
+                # Encode once and write the bytes directly, keeping the platform's line endings
+                data = (header + body).encode('utf-8')
+                if os.linesep != '\n':
+                    data = data.replace(b'\n', os.linesep.encode('ascii'))
+                with open(filepath, 'wb') as f:
+                    f.write(data)
                 
                 if not auto_save:
                     QMessageBox.information(self, "Success", f"📄 Headlines exported to {filepath}")
@@ -1539,22 +1629,15 @@ class NewsScraperApp(QMainWindow):
             return
             
         filepath, _ = QFileDialog.getSaveFileName(
-            self, "Save Headlines CSV", f"headlines_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            self, "Save Headlines CSV", self.export_filename('csv'),
             "CSV Files (*.csv)")
             
         if filepath:
             try:
-                with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                with open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                     writer = csv.writer(f)
                     writer.writerow(['Title', 'Source', 'Timestamp', 'URL'])
-                    
-                    for headline in self.headlines:
-                        writer.writerow([
-                            headline['title'],
-                            headline['source'],
-                            headline['timestamp'],
-                            headline['url']
-                        ])
+                    writer.writerows(self.headlines)  # Headline fields are in column order
                 
                 QMessageBox.information(self, "Success", f"📊 Headlines exported to {filepath}")
                 self.status_bar.showMessage(f"📊 Exported {len(self.headlines)} headlines to CSV")
@@ -1569,30 +1652,27 @@ class NewsScraperApp(QMainWindow):
             return
             
         filepath, _ = QFileDialog.getSaveFileName(
-            self, "Save Headlines JSON", f"headlines_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            self, "Save Headlines JSON", self.export_filename('json'),
             "JSON Files (*.json)")
             
         if filepath:
             try:
-                export_data = {
-                    'export_info': {
-                        'application': 'Professional News Headlines Scraper v2.0',
-                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'total_headlines': len(self.headlines),
-                        'unique_sources': list(set(h['source'] for h in self.headlines)),
-                        'source_counts': {}
-                    },
-                    'headlines': self.headlines
+                export_info = {
+                    'application': 'Professional News Headlines Scraper v2.0',
+                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'total_headlines': len(self.headlines),
+                    'unique_sources': list(self._source_counter),
+                    'source_counts': dict(self._source_counter)
                 }
                 
-                # Add source counts
-                for headline in self.headlines:
-                    source = headline['source']
-                    export_data['export_info']['source_counts'][source] = \
-                        export_data['export_info']['source_counts'].get(source, 0) + 1
-                
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                # Stream the headlines one at a time rather than serializing the whole document at once
+                with open(filepath, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write(b'{\n  "export_info": ' + json_bytes(export_info, 1) + b',\n  "headlines": [\n')
+                    for i, headline in enumerate(self.headlines):
+                        if i:
+                            f.write(b',\n')
+                        f.write(b'    ' + json_bytes(headline._asdict(), 2))
+                    f.write(b'\n  ]\n}')
                 
                 QMessageBox.information(self, "Success", f"📋 Headlines exported to {filepath}")
                 self.status_bar.showMessage(f"📋 Exported {len(self.headlines)} headlines to JSON")
@@ -1600,9 +1680,10 @@ class NewsScraperApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export JSON: {str(e)}")
                 
-    def open_url(self, row, column):
+    def open_url(self, index):
         """Open URL when table cell is double-clicked"""
-        url = self.results_table.item(row, 3).text()  # URL is in column 3
+        # The model shares self.headlines, so its source rows index the list directly
+        url = self.headlines[self.results_proxy.mapToSource(index).row()].url
         if url and url.startswith('http'):
             try:
                 webbrowser.open(url)
@@ -1648,12 +1729,13 @@ class NewsScraperApp(QMainWindow):
     def save_settings(self):
         """Save application settings"""
         try:
-            self.settings.setValue('auto_refresh_enabled', self.auto_refresh_check.isChecked())
-            self.settings.setValue('refresh_interval', self.refresh_interval_spin.value())
-            self.settings.setValue('auto_save_enabled', self.auto_save_check.isChecked())
-            self.settings.setValue('request_timeout', self.timeout_spin.value())
-            self.settings.setValue('request_delay', self.delay_spin.value())
-            self.settings.setValue('max_headlines', self.max_headlines_spin.value())
+            self.store_setting('auto_refresh_enabled', self.auto_refresh_check.isChecked())
+            self.store_setting('refresh_interval', self.refresh_interval_spin.value())
+            self.store_setting('auto_save_enabled', self.auto_save_check.isChecked())
+            self.store_setting('request_timeout', self.timeout_spin.value())
+            self.store_setting('request_delay', self.delay_spin.value())
+            self.store_setting('max_headlines', self.max_headlines_spin.value())
+            self.settings.sync()
             
             # Setup auto-refresh timer
             if self.auto_refresh_check.isChecked():
@@ -1671,24 +1753,40 @@ class NewsScraperApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save settings: {str(e)}")
         
+    def store_setting(self, key, value):
+        """Write a setting to QSettings only when it differs from the stored value"""
+        if not self.settings.contains(key) or self.settings.value(key, type=type(value)) != value:
+            self.settings.setValue(key, value)
+            
+    def setting(self, widget_name, key, default):
+        """Read a setting from its widget, or from QSettings while the Settings tab is unbuilt"""
+        widget = getattr(self, widget_name, None)
+        if widget is None:
+            return self.settings.value(key, default, type=type(default))
+        return widget.isChecked() if isinstance(widget, QCheckBox) else widget.value()
+        
     def load_settings(self):
         """Load saved settings"""
         try:
+            self.max_headlines_spin.setValue(
+                self.settings.value('max_headlines', 50, type=int))
             if hasattr(self, 'auto_refresh_check'):
-                self.auto_refresh_check.setChecked(
-                    self.settings.value('auto_refresh_enabled', False, type=bool))
-                self.refresh_interval_spin.setValue(
-                    self.settings.value('refresh_interval', 30, type=int))
-                self.auto_save_check.setChecked(
-                    self.settings.value('auto_save_enabled', False, type=bool))
-                self.timeout_spin.setValue(
-                    self.settings.value('request_timeout', 10, type=int))
-                self.delay_spin.setValue(
-                    self.settings.value('request_delay', 1, type=int))
-                self.max_headlines_spin.setValue(
-                    self.settings.value('max_headlines', 50, type=int))
+                self.load_settings_tab()
         except Exception as e:
             print(f"Error loading settings: {e}")
+            
+    def load_settings_tab(self):
+        """Load saved values into the Settings tab widgets"""
+        self.auto_refresh_check.setChecked(
+            self.settings.value('auto_refresh_enabled', False, type=bool))
+        self.refresh_interval_spin.setValue(
+            self.settings.value('refresh_interval', 30, type=int))
+        self.auto_save_check.setChecked(
+            self.settings.value('auto_save_enabled', False, type=bool))
+        self.timeout_spin.setValue(
+            self.settings.value('request_timeout', 10, type=int))
+        self.delay_spin.setValue(
+            self.settings.value('request_delay', 1, type=int))
                 
     def test_single_url(self):
         """Test a single URL to diagnose scraping issues"""
@@ -1710,73 +1808,64 @@ class NewsScraperApp(QMainWindow):
         
         # Run test in background
         def run_test():
+            # Output is collected and handed to the widget in one update per stage
+            lines = []
+            log = lines.append
+            
+            def flush():
+                if lines:
+                    self.test_log.emit("\n".join(lines))
+                    lines.clear()
+                    
             try:
-                # Test with enhanced headers
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                }
-                
-                self.test_results.append("📡 Sending request with browser headers...")
-                QApplication.processEvents()
+                # Browser-like headers are set once on the shared session
+                log("📡 Sending request with browser headers...")
+                flush()
                 
-                response = requests.get(url, headers=headers, timeout=15)
+                response = HTTP_SESSION.get(url, timeout=15)
                 
-                self.test_results.append(f"📊 Response Status: {response.status_code}")
-                self.test_results.append(f"📏 Content Length: {len(response.content):,} bytes")
+                log(f"📊 Response Status: {response.status_code}")
+                log(f"📏 Content Length: {len(response.content):,} bytes")
                 
                 if response.status_code == 200:
                     # Parse content
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Try different selectors
-                    selectors_to_try = [
-                        'h1', 'h2', 'h3', 'h4',
-                        '.title a', '.headline', '.story-title',
-                        'a[href*="news"]', 'a[href*="story"]',
-                        '.ie-custom-story-item h3 a',  # Indian Express specific
-                        '.story-details h3 a'  # Indian Express specific
-                    ]
+                    soup = BeautifulSoup(response.content, 'lxml')
                     
+                    # Try common headline selectors
                     found_elements = {}
-                    for selector in selectors_to_try:
-                        try:
-                            elements = soup.select(selector)
-                            if elements:
-                                found_elements[selector] = len(elements)
-                        except Exception as e:
-                            continue
+                    for selector, compiled in COMPILED_DIAGNOSTIC_SELECTORS:
+                        elements = compiled.select(soup)
+                        if elements:
+                            found_elements[selector] = elements
+                            if len(elements) >= DIAGNOSTIC_STRONG_MATCH and len(found_elements) >= 3:
+                                break
                     
                     if found_elements:
-                        self.test_results.append("\n✅ Found potential headline selectors:")
-                        for selector, count in sorted(found_elements.items(), key=lambda x: x[1], reverse=True):
-                            self.test_results.append(f"   🎯 '{selector}': {count} elements")
+                        log("\n✅ Found potential headline selectors:")
+                        for selector, elements in sorted(found_elements.items(), key=lambda x: len(x[1]), reverse=True):
+                            log(f"   🎯 '{selector}': {len(elements)} elements")
                             
                         # Show sample headlines
-                        best_selector = max(found_elements.items(), key=lambda x: x[1])[0]
-                        sample_elements = soup.select(best_selector)[:3]
+                        best_selector, best_elements = max(found_elements.items(), key=lambda x: len(x[1]))
+                        sample_elements = best_elements[:3]
                         
-                        self.test_results.append(f"\n📰 Sample headlines using '{best_selector}':")
+                        log(f"\n📰 Sample headlines using '{best_selector}':")
                         for i, elem in enumerate(sample_elements):
                             title = elem.get_text().strip()[:100]
                             if title:
-                                self.test_results.append(f"   {i+1}. {title}...")
+                                log(f"   {i+1}. {title}...")
                                 
                     else:
-                        self.test_results.append("\n❌ No headline elements found with common selectors")
-                        self.test_results.append("💡 Try adding custom CSS selectors for this site")
+                        log("\n❌ No headline elements found with common selectors")
+                        log("💡 Try adding custom CSS selectors for this site")
                         
                 elif response.status_code == 403:
-                    self.test_results.append("\n🚫 403 Forbidden - Website is blocking automated requests")
-                    self.test_results.append("\n💡 Possible Solutions:")
-                    self.test_results.append("   • Try using a VPN service")
-                    self.test_results.append("   • Use RSS feed if available")
-                    self.test_results.append("   • Contact website for API access")
-                    self.test_results.append("   • Try different user agent strings")
+                    log("\n🚫 403 Forbidden - Website is blocking automated requests")
+                    log("\n💡 Possible Solutions:")
+                    log("   • Try using a VPN service")
+                    log("   • Use RSS feed if available")
+                    log("   • Contact website for API access")
+                    log("   • Try different user agent strings")
                     
                     # Check for RSS feed
                     try:
@@ -1786,47 +1875,48 @@ class NewsScraperApp(QMainWindow):
                             url.rstrip('/') + '/rss.xml'
                         ]
                         
-                        for rss_url in rss_urls:
-                            try:
-                                rss_response = requests.get(rss_url, headers=headers, timeout=5)
-                                if rss_response.status_code == 200 and 'xml' in rss_response.headers.get('content-type', ''):
-                                    self.test_results.append(f"   📡 RSS feed found: {rss_url}")
+                        # The candidates are independent, so probe them all at once
+                        with ThreadPoolExecutor(max_workers=len(rss_urls)) as probe_pool:
+                            for rss_url, found in zip(rss_urls, probe_pool.map(is_rss_feed, rss_urls)):
+                                if found:
+                                    log(f"   📡 RSS feed found: {rss_url}")
                                     break
-                            except:
-                                continue
                     except:
                         pass
                         
                 elif response.status_code == 429:
-                    self.test_results.append("\n⏳ 429 Too Many Requests - Rate limited")
-                    self.test_results.append("💡 Increase delay between requests in Advanced Settings")
+                    log("\n⏳ 429 Too Many Requests - Rate limited")
+                    log("💡 Increase delay between requests in Advanced Settings")
                     
                 else:
-                    self.test_results.append(f"\n❓ Unexpected status code: {response.status_code}")
+                    log(f"\n❓ Unexpected status code: {response.status_code}")
                     
             except requests.exceptions.Timeout:
-                self.test_results.append("\n⏰ Request timeout - Website is slow or unreachable")
-                self.test_results.append("💡 Try increasing timeout in Advanced Settings")
+                log("\n⏰ Request timeout - Website is slow or unreachable")
+                log("💡 Try increasing timeout in Advanced Settings")
                 
             except requests.exceptions.ConnectionError:
-                self.test_results.append("\n🌐 Connection error - Check internet connection")
-                self.test_results.append("💡 Verify the URL is correct and accessible")
+                log("\n🌐 Connection error - Check internet connection")
+                log("💡 Verify the URL is correct and accessible")
                 
             except Exception as e:
-                self.test_results.append(f"\n❌ Unexpected error: {str(e)}")
+                log(f"\n❌ Unexpected error: {str(e)}")
                 
             finally:
-                # Re-enable button
-                QApplication.processEvents()
-                self.test_url_btn.setEnabled(True)
-                self.test_url_btn.setText("🧪 Test URL")
-                self.test_results.append(f"\n{'=' * 50}")
-                self.test_results.append("🏁 Test completed")
+                log(f"\n{'=' * 50}")
+                log("🏁 Test completed")
+                flush()
+                self.test_finished.emit()
         
         # Run in background thread
         test_thread = threading.Thread(target=run_test)
         test_thread.daemon = True
         test_thread.start()
+        
+    def url_test_finished(self):
+        """Re-enable the URL test button once a test has finished"""
+        self.test_url_btn.setEnabled(True)
+        self.test_url_btn.setText("🧪 Test URL")
                 
     def closeEvent(self, event):
         """Handle application close event"""
@@ -1843,6 +1933,10 @@ class NewsScraperApp(QMainWindow):
                 self.scraper_thread.stop()
                 self.scraper_thread.wait()
         
+        # Stop the parser worker processes
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown(wait=False, cancel_futures=True)
+        
         # Save window geometry
         self.settings.setValue('geometry', self.saveGeometry())
         self.settings.setValue('window_state', self.saveState())
@@ -1866,7 +1960,7 @@ class SplashScreen(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Background with gradient
+        # All splash styling lives in one sheet, parsed once for every widget
         self.setStyleSheet("""
             QWidget {
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
@@ -1874,6 +1968,49 @@ class SplashScreen(QWidget):
                 border-radius: 20px;
                 color: #ffffff;
             }
+            QLabel#splashIcon {
+                font-size: 64px; 
+                color: #ffffff; 
+                margin-bottom: 10px;
+                background: transparent;
+            }
+            QLabel#splashTitle {
+                color: #ffffff; 
+                font-size: 22px; 
+                font-weight: 700; 
+                margin-bottom: 5px;
+                background: transparent;
+            }
+            QLabel#splashSubtitle {
+                color: #bdc3c7; 
+                font-size: 14px; 
+                font-weight: 400; 
+                margin-bottom: 10px;
+                background: transparent;
+            }
+            QLabel#splashVersion {
+                color: #ecf0f1; 
+                font-size: 12px; 
+                margin-bottom: 20px;
+                background: transparent;
+            }
+            QLabel#splashStatus {
+                color: #ffffff; 
+                font-size: 12px; 
+                margin-bottom: 10px;
+                background: transparent;
+            }
+            QProgressBar#splashProgress {
+                border: none;
+                border-radius: 3px;
+                background-color: rgba(255, 255, 255, 0.2);
+                text-align: center;
+            }
+            QProgressBar#splashProgress::chunk {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #3498db, stop:1 #2980b9);
+                border-radius: 3px;
+            }
         """)
         
         # Content
@@ -1884,72 +2021,33 @@ class SplashScreen(QWidget):
         # Logo/Icon
         icon_label = QLabel("📰")
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_label.setStyleSheet("""
-            font-size: 64px; 
-            color: #ffffff; 
-            margin-bottom: 10px;
-            background: transparent;
-        """)
+        icon_label.setObjectName("splashIcon")
         
         # Title
         title_label = QLabel("NewsVision")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            color: #ffffff; 
-            font-size: 22px; 
-            font-weight: 700; 
-            margin-bottom: 5px;
-            background: transparent;
-        """)
+        title_label.setObjectName("splashTitle")
         
         # Subtitle
         subtitle_label = QLabel("Advanced Web Scraping Tool")
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle_label.setStyleSheet("""
-            color: #bdc3c7; 
-            font-size: 14px; 
-            font-weight: 400; 
-            margin-bottom: 10px;
-            background: transparent;
-        """)
+        subtitle_label.setObjectName("splashSubtitle")
         
         # Version
         version_label = QLabel("Version 2.0 Professional")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version_label.setStyleSheet("""
-            color: #ecf0f1; 
-            font-size: 12px; 
-            margin-bottom: 20px;
-            background: transparent;
-        """)
+        version_label.setObjectName("splashVersion")
         
         # Loading text
         self.loading_label = QLabel("Initializing application...")
         self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.loading_label.setStyleSheet("""
-            color: #ffffff; 
-            font-size: 12px; 
-            margin-bottom: 10px;
-            background: transparent;
-        """)
+        self.loading_label.setObjectName("splashStatus")
         
         # Progress bar
         self.progress = QProgressBar()
         self.progress.setRange(0, 0)  # Indeterminate progress
         self.progress.setFixedHeight(6)
-        self.progress.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 3px;
-                background-color: rgba(255, 255, 255, 0.2);
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #3498db, stop:1 #2980b9);
-                border-radius: 3px;
-            }
-        """)
+        self.progress.setObjectName("splashProgress")
         
         content_layout.addWidget(icon_label)
         content_layout.addWidget(title_label)
@@ -1998,33 +2096,35 @@ def main():
     # Show splash screen
     splash = SplashScreen()
     splash.show()
+    splash_shown = time.monotonic()
     
     # Process events to show splash
     app.processEvents()
     
-    # Small delay to show splash
-    import time
-    time.sleep(3)  # Longer delay to appreciate the professional splash
-    
-    # Create main window
+    # Create main window while the splash is on screen
     window = NewsScraperApp()
     
-    # Close splash and show main window
-    splash.close()
-    window.show()
-    
-    # Restore window geometry if saved
-    geometry = window.settings.value('geometry')
-    if geometry:
-        window.restoreGeometry(geometry)
-        
-    window_state = window.settings.value('window_state')
-    if window_state:
-        window.restoreState(window_state)
+    def show_main_window():
+        # Close splash and show main window
+        splash.close()
+        window.show()
+        
+        # Restore window geometry if saved
+        geometry = window.settings.value('geometry')
+        if geometry:
+            window.restoreGeometry(geometry)
+            
+        window_state = window.settings.value('window_state')
+        if window_state:
+            window.restoreState(window_state)
+        
+        # Ensure window is visible and properly sized
+        window.raise_()
+        window.activateWindow()
     
-    # Ensure window is visible and properly sized
-    window.raise_()
-    window.activateWindow()
+    # Keep the splash up for three seconds in total, counting window construction
+    elapsed_ms = int((time.monotonic() - splash_shown) * 1000)
+    QTimer.singleShot(max(0, 3000 - elapsed_ms), show_main_window)
     
     sys.exit(app.exec())
 